@@ -0,0 +1,5 @@
+from .exceptions import MissingParameter
+from .machine import Enigma, PositionsBruteforcer, countbruteforce, Decryptor, decrypt_many
+from .scoring import calcic, calcfrequencies
+from .keys import IncreaseKey, DecreaseKey, AllKeys, ModifyKeys, CalcKeys
+from .attacks import rotor_coincidence_attack, rotor_coincidence_screening_attack, plugboard_coincidence_attack, plaintextattack, repetitionattack
@@ -0,0 +1,226 @@
+import heapq
+import json
+import re
+from .exceptions import MissingParameter
+from .machine import Enigma, PositionsBruteforcer, Decryptor, decrypt_many
+from .scoring import calcic
+
+
+SCREEN_LENGTH_MIN = 250
+
+
+def rotor_coincidence_attack(ciphertext, number2save, dictionnary, model, nbpos, ofile):
+  import progressbar
+  bar = progressbar.ProgressBar(max_value=nbpos)
+  bruteforcer = PositionsBruteforcer(ciphertext, model, dictionnary)
+  ics = [0]*number2save
+  confs = [""]*number2save
+  for i in range(int(nbpos)):
+    unencrypted, conf = bruteforcer.next()
+    unencryptedIC = calcic(unencrypted)
+    if ics.count(0):
+      index = ics.index(0)
+      ics[index] = unencryptedIC
+      confs[index] = json.dumps(conf)
+      ics, confs = (list(t) for t in zip(*sorted(zip(ics, confs))))
+    else:
+      for n, ic in enumerate(ics):
+        if unencryptedIC > ic:
+          ics = [unencryptedIC] + ics[1:]
+          confs = [json.dumps(conf)] + confs[1:]
+          ics, confs = (list(t) for t in zip(*sorted(zip(ics, confs))))
+          break
+    bar.update(i)
+  bar.finish()
+  f=open(ofile, "a")
+  for conf in confs:
+    f.write(conf + "\n")
+  f.close()
+
+
+
+def KeepBest(heap, size, ic, index, conf):
+  if len(heap) < size:
+    heapq.heappush(heap, (ic, index, conf))
+  elif ic > heap[0][0]:
+    heapq.heapreplace(heap, (ic, index, conf))
+
+
+
+def rotor_coincidence_screening_attack(ciphertext, number2save, dictionnary, model, nbpos, ofile, shortlist_ratio, screen_length=None, benchmark=False):
+  import progressbar
+  if not screen_length:
+    screen_length = max(len(ciphertext)//10, SCREEN_LENGTH_MIN)
+  if screen_length >= len(ciphertext):
+    rotor_coincidence_attack(ciphertext, number2save, dictionnary, model, nbpos, ofile)
+    return {"TwoPhase":False, "ScreenLength":len(ciphertext), "Characters":nbpos*len(ciphertext), "FullCharacters":nbpos*len(ciphertext)}
+  shortlist_size = max(number2save, int(nbpos*shortlist_ratio))
+  bar = progressbar.ProgressBar(max_value=nbpos)
+  if benchmark:
+    bruteforcer = PositionsBruteforcer(ciphertext, model, dictionnary)
+  else:
+    bruteforcer = PositionsBruteforcer(ciphertext[:screen_length], model, dictionnary)
+  shortlist = []
+  fullbest = []
+  for i in range(int(nbpos)):
+    unencrypted, conf = bruteforcer.next()
+    KeepBest(shortlist, shortlist_size, calcic(unencrypted[:screen_length]), i, json.dumps(conf))
+    if benchmark:
+      KeepBest(fullbest, number2save, calcic(unencrypted), i, json.dumps(conf))
+    bar.update(i)
+  bar.finish()
+
+  shortlistconfs = [conf for ic, i, conf in shortlist]
+  unencrypteds = decrypt_many(shortlistconfs, [ciphertext]*len(shortlistconfs), Decryptor())
+  best = []
+  for (prefixIC, i, conf), unencrypted in zip(shortlist, unencrypteds):
+    KeepBest(best, number2save, calcic(unencrypted), i, conf)
+  confs = [conf for ic, i, conf in sorted(best)]
+  f=open(ofile, "a")
+  for conf in confs:
+    f.write(conf + "\n")
+  f.close()
+
+  stats = {"TwoPhase":True, "ScreenLength":screen_length, "Shortlist":len(shortlist), "Characters":nbpos*screen_length + len(shortlist)*len(ciphertext), "FullCharacters":nbpos*len(ciphertext)}
+  if benchmark:
+    fullconfs = [conf for ic, i, conf in sorted(fullbest)]
+    stats["BenchmarkCharacters"] = nbpos*len(ciphertext) + len(shortlist)*len(ciphertext)
+    stats["Recall"] = len(set(confs) & set(fullconfs))/len(fullconfs)
+    stats["BestKept"] = fullconfs[-1] in confs
+  return stats
+
+
+
+def plugboard_coincidence_attack(ciphertext, model, dictionnary, nblines, ofile):
+  import progressbar
+  bar = progressbar.ProgressBar(max_value=((26*25)/2)*nblines)
+  bruteforcer = PositionsBruteforcer(ciphertext, model, dictionnary, plugs=True)
+  nbplugs = model["Plugboard"]
+  confs = []
+  for i in range(int(nblines)):
+    plugs = []
+    ics = []
+    for n in range(int((26*25)/2)):
+      unencrypted, conf = bruteforcer.NextDictPlug()
+      ics.append(calcic(unencrypted))
+      plugs.append(conf["Plugboard"])
+      bar.update(i*((26*25)/2)+n)
+    ics, plugs = (list(t) for t in zip(*sorted(zip(ics, plugs))))
+    validplugs = " ".join(plugs[-model["Plugboard"]:])
+    conf["Plugboard"] = validplugs
+    confs.append(json.dumps(conf))
+  bar.finish()
+  f=open(ofile, "a")
+  for conf in confs:
+    f.write(conf + "\n")
+  f.close()
+
+
+
+def plaintextattack(ciphertext, known_plaintext, input_plugboard, cycle_plugboard, dictionnary, model, nbpos, ofile):
+  import progressbar
+  bar = progressbar.ProgressBar(max_value=nbpos)
+  bruteforcer = PositionsBruteforcer(ciphertext, model, dictionnary)
+  confs = []
+  for i in range(int(nbpos)):
+    unencrypted, conf = bruteforcer.next()
+    if unencrypted == known_plaintext:
+      confs.append(json.dumps(conf))
+
+    elif input_plugboard:
+      plugs = []
+      valid = True
+      for n,uchar in enumerate(unencrypted):
+        pchar = known_plaintext[n]
+        if uchar != pchar and not uchar + pchar in plugs and not pchar + uchar in plugs:
+          r = re.compile("."+pchar+"|"+pchar+"."+"|"+"."+uchar+"|"+uchar+".")
+          if list(filter(r.match, plugs)):
+            valid = False
+            break
+          plugs.append(uchar+pchar)
+        elif uchar == pchar:
+          r = re.compile("."+pchar+"|"+pchar+".")
+          if list(filter(r.match, plugs)):
+            valid = False
+            break
+      if valid and len(plugs) <= model["Plugboard"]:
+        conf["Plugboard"] = " ".join(plugs)
+        testenigma = Enigma(conf)
+        if testenigma.Process(ciphertext, conf["Key"]) == known_plaintext:
+          confs.append(json.dumps(conf))
+        conf["Plugboard"] = ""
+
+    elif cycle_plugboard:
+      celements = cycle_plugboard.split(" ")
+      valid = True
+      for n, celement in enumerate(celements):
+        if n == len(celements)-1:
+          nextcelement = celements[0]
+        else:
+          nextcelement = celements[n+1]
+        if celement[0] == "P":
+          currentchar = ciphertext[int(celement[1])]
+        elif celement[0] == "E":
+          currentchar = unencrypted[int(celement[1])]
+        if nextcelement[0] == "P":
+          nextchar = unencrypted[int(nextcelement[1])]
+        elif nextcelement[0] == "E":
+          nextchar = ciphertext[int(nextcelement[1])]
+        if currentchar != nextchar:
+          valid = False
+      if valid:
+        confs.append(json.dumps(conf))
+
+    bar.update(i)
+  bar.finish()
+  f=open(ofile, "a")
+  for conf in confs:
+    f.write(conf + "\n")
+  f.close()
+
+
+
+def repetitionattack(repeated_text, dictionnary, model, nbpos, ofile):
+  import progressbar
+  bar = progressbar.ProgressBar(max_value=nbpos)
+  if ":" in repeated_text:
+    splited = repeated_text.split(":")
+    distances = [0]*len(splited)
+  elif "." in repeated_text:
+    splited = repeated_text.split(".")
+    distances = []
+    counter = 0
+    for split in splited:
+      if split == "":
+        counter +=1
+      if split != "":
+        distances.append(counter+1)
+        counter = 0
+    distances = distances[1:]
+    distances.append(0)
+    splited = list(filter(None, splited))
+  else:
+    raise MissingParameter("Repeated text is not in valid format, please use --help")
+  bruteforcer = PositionsBruteforcer(splited[0], model, dictionnary)
+  confs = []
+  for i in range(int(nbpos)):
+    unencrypted, conf = bruteforcer.next()
+    query = ""
+    for n in range(len(splited)):
+      query += unencrypted+"x"*distances[n]
+    reencrypted = bruteforcer.ProcessSameConf(query)
+    splitedreencrypted = []
+    debut = 0
+    fin = len(splited[0])
+    for ni in range(len(splited)):
+      splitedreencrypted.append(reencrypted[debut:fin])
+      debut = fin + distances[ni]
+      fin = debut + len(splited[0])
+    if splitedreencrypted == splited:
+      confs.append(json.dumps(conf))
+    bar.update(i)
+  bar.finish()
+  f=open(ofile, "a")
+  for conf in confs:
+    f.write(conf + "\n")
+  f.close()
@@ -0,0 +1,2 @@
+class MissingParameter(Exception):
+  pass
@@ -0,0 +1,126 @@
+import json
+from .machine import Enigma, PositionsBruteforcer
+
+
+def IncreaseKey(key, rotors):
+  if len(key) == 0:
+    return ""
+  else:
+    if key[-1] == "Z":
+      key = key[:-1] + "A"
+    else:
+      key = key[:-1] + chr(ord(key[-1])+1)
+    if len(key) > 1:
+      rotor1 = (rotors[-1] == "I" and key[-1] == "R")
+      rotor2 = (rotors[-1] == "II" and key[-1] == "F")
+      rotor3 = (rotors[-1] == "III" and key[-1] == "W")
+      rotor4 = (rotors[-1] == "IV" and key[-1] == "K")
+      rotor5 = (rotors[-1] == "V" and key[-1] == "A")
+      rotor678 = ((rotors[-1] == "VI" or rotors[-1] == "VII" or rotors[-1] == "VIII") and (key[-1] == "A" or key[-1] == "N"))
+      protor1 = (rotors[-2] == "I" and key[-2] == "Q")
+      protor2 = (rotors[-2] == "II" and key[-2] == "E")
+      protor3 = (rotors[-2] == "III" and key[-2] == "V")
+      protor4 = (rotors[-2] == "IV" and key[-2] == "J")
+      protor5 = (rotors[-2] == "V" and key[-2] == "Z")
+      protor678 = ((rotors[-2] == "VI" or rotors[-2] == "VII" or rotors[-2] == "VIII") and (key[-2] == "Z" or key[-2] == "M"))
+      if (rotor1 or rotor2 or rotor3 or rotor4 or rotor5 or rotor678) and len(rotors) >= 2 and not (rotors[-2] == "Beta" or rotors[-2] == "Gamma"):
+        key = IncreaseKey(key[:-1], rotors[:-1]) + key[-1]
+      elif (protor1 or protor2 or protor3 or protor4 or protor5 or protor678) and len(rotors) > 2 and not (rotors[-3] == "Beta" or rotors[-3] == "Gamma"):
+        if key[-2] == "Z":
+          key2 = "A"
+        else:
+          key2 = chr(ord(key[-2])+1)
+        key = IncreaseKey(key[:-2], rotors[:-2]) + key2 + key[-1]
+    return key
+
+
+
+def DecreaseKey(key, rotors):
+  if len(key) == 0:
+    return ""
+  else:
+    if key[-1] == "A":
+      key = key[:-1] + "Z"
+    else:
+      key = key[:-1] + chr(ord(key[-1])-1)
+    if len(key) > 1:
+      rotor1 = (rotors[-1] == "I" and key[-1] == "Q")
+      rotor2 = (rotors[-1] == "II" and key[-1] == "E")
+      rotor3 = (rotors[-1] == "III" and key[-1] == "V")
+      rotor4 = (rotors[-1] == "IV" and key[-1] == "J")
+      rotor5 = (rotors[-1] == "V" and key[-1] == "Z")
+      rotor678 = ((rotors[-1] == "VI" or rotors[-1] == "VII" or rotors[-1] == "VIII") and (key[-1] == "Z" or key[-1] == "M"))
+      protor1 = (rotors[-2] == "I" and key[-2] == "R")
+      protor2 = (rotors[-2] == "II" and key[-2] == "F")
+      protor3 = (rotors[-2] == "III" and key[-2] == "W")
+      protor4 = (rotors[-2] == "IV" and key[-2] == "K")
+      protor5 = (rotors[-2] == "V" and key[-2] == "A")
+      protor678 = ((rotors[-2] == "VI" or rotors[-2] == "VII" or rotors[-2] == "VIII") and (key[-2] == "A" or key[-2] == "N"))
+      if (rotor1 or rotor2 or rotor3 or rotor4 or rotor5 or rotor678) and len(rotors) >= 2 and not (rotors[-2] == "Beta" or rotors[-2] == "Gamma"):
+        key = DecreaseKey(key[:-1], rotors[:-1]) + key[-1]
+      elif (protor1 or protor2 or protor3 or protor4 or protor5 or protor678) and len(rotors) > 2 and not (rotors[-3] == "Beta" or rotors[-3] == "Gamma"):
+        if key[-2] == "A":
+          key2 = "Z"
+        else:
+          key2 = chr(ord(key[-2])-1)
+        key = DecreaseKey(key[:-2], rotors[:-2]) + key2 + key[-1]
+    return key
+
+
+
+def AllKeys(dictionnary, model, nbpos):
+  import progressbar
+  bar = progressbar.ProgressBar(max_value=nbpos)
+  bruteforcer = PositionsBruteforcer("A", model, dictionnary, dicobrutekey=True)
+  confs = []
+  for i in range(int(nbpos)):
+    unencrypted, conf, newkey = bruteforcer.NextDictBrute()
+    conf["Key"] = newkey
+    confs.append(json.dumps(conf))
+    bar.update(i)
+  bar.finish()
+  f= open(dictionnary + "-allkeys", "a")
+  confs = set(confs)
+  for conf in confs:
+    f.write(conf+"\n")
+  f.close()
+
+
+
+def ModifyKeys(shift, dictionnary, nbpos):
+  import progressbar
+  bar = progressbar.ProgressBar(max_value=nbpos)
+  lines = open(dictionnary).readlines()
+  confs = []
+  for i in range(int(nbpos)):
+    conf = json.loads(lines[i].replace("\n", ""))
+    for n in range(shift):
+      newkey = DecreaseKey(conf["Key"], conf["Rotors"].split(" "))
+      conf["Key"] = newkey
+    confs.append(conf)
+    bar.update(i)
+  bar.finish()
+  f=open(dictionnary+"-modifiedkeys", "a")
+  for conf in confs:
+    f.write(json.dumps(conf) + "\n")
+  f.close()
+
+
+
+def CalcKeys(cipheredkey, dictionnary, nbpos):
+  import progressbar
+  bar = progressbar.ProgressBar(max_value=nbpos)
+  lines = open(dictionnary).readlines()
+  confs = []
+  for i, line in enumerate(lines):
+    conf = json.loads(line.replace("\n", ""))
+    machine = Enigma(conf)
+    clearkey = machine.Process(cipheredkey, conf["Key"])
+    conf["Key"] = clearkey
+    confs.append(conf)
+    bar.update(i)
+  bar.finish()
+  f=open(dictionnary+"-calckeys", "a")
+  for conf in confs:
+    f.write(json.dumps(conf)+"\n")
+  f.close()
@@ -0,0 +1,186 @@
+import collections
+import copy
+import json
+import threading
+from enigma.machine import EnigmaMachine
+
+
+class Enigma:
+  def __init__(self, configuration):
+    self.machine = EnigmaMachine.from_key_sheet(
+      rotors = configuration["Rotors"],
+      reflector = configuration["Reflector"],
+      ring_settings = configuration["Ring"],
+      plugboard_settings = configuration["Plugboard"])
+
+  def Process(self, text, key):
+    self.machine.set_display(key)
+    return self.machine.process_text(text, replace_char=None)
+
+
+
+class PositionsBruteforcer:
+  def __init__(self, text, model, file, dicobrutekey=False, plugs=False):
+    self.text = text
+    self.model = model
+    self.configuration = ""
+    if file:
+      if dicobrutekey:
+        self.next = self.NextDictBrute
+        self.lastkey = "Z" * model["RotorsCount"]
+      elif plugs:
+        self.lastplug = "YZ"
+        self.next = self.NextDictPlug
+      else:
+        self.next = self.NextDict
+      self.lastline = -1
+      self.lines = open(file).readlines()
+      self.lastconf = ""
+    else:
+      self.next = self.NextBrute
+      self.lastreflector = model["Reflectors"][-1]
+      self.lastmachine = -1
+      self.lastkey = "Z"*model["RotorsCount"]
+      self.rotorslist = [" ".join([model["Rotors"][0]]*model["RotorsCount"])]
+      while self.rotorslist[-1] != " ".join([model["Rotors"][-1]]*model["RotorsCount"]):
+        i = -1
+        lastrotor = self.rotorslist[-1].split(" ")
+        while lastrotor[i] == model["Rotors"][-1]:
+          lastrotor = lastrotor[:i] +[model["Rotors"][0]] + lastrotor[i:][1:]
+          i -= 1
+        rotor = lastrotor[:i] + [model["Rotors"][model["Rotors"].index(lastrotor[i])+1]] + lastrotor[i:][1:]
+        rotor = " ".join(rotor)
+        self.rotorslist.append(rotor)
+      if not model["Duplicates"]:
+        newrotorslist = []
+        for rotor in self.rotorslist:
+          rotor = rotor.split(" ")
+          if len(rotor) == len(set(rotor)):
+            newrotorslist.append(" ".join(rotor))
+        self.rotorslist = newrotorslist
+
+  def NextDict(self):
+    line = self.lastline + 1
+    configuration = json.loads(self.lines[line].replace("\n", ""))
+    confWkey = copy.deepcopy(configuration)
+    del confWkey["Key"]
+    if confWkey != self.lastconf:
+      self.myenigma = Enigma(configuration)
+    self.lastkey = configuration["Key"]
+    unencrypted = self.myenigma.Process(self.text, self.lastkey)
+    self.lastline = line
+    self.lastconf = confWkey
+    return unencrypted, configuration
+
+  def NextBrute(self):
+    if self.lastkey == "Z"*self.model["RotorsCount"]:
+      if self.lastreflector != self.model["Reflectors"][-1]:
+        self.configuration["Reflector"] = self.model["Reflectors"][self.model["Reflectors"].index(self.lastreflector)+1]
+      else:
+        self.lastmachine += 1
+        self.configuration = {"Rotors":self.rotorslist[self.lastmachine],"Reflector":self.model["Reflectors"][0], "Ring":[0]*self.model["RotorsCount"], "Plugboard":""}
+      self.lastreflector = self.configuration["Reflector"]
+      self.lastkey = "A"*self.model["RotorsCount"]
+      self.myenigma = Enigma(self.configuration)
+    else:
+      i = -1
+      while self.lastkey[i] == "Z":
+        self.lastkey = self.lastkey[:i] + "A" + self.lastkey[i:][1:]
+        i -= 1
+      self.lastkey = self.lastkey[:i] + chr(ord(self.lastkey[i])+1) + self.lastkey[i:][1:]
+    unencrypted = self.myenigma.Process(self.text, self.lastkey)
+    self.configuration["Key"] = self.lastkey
+    conf = self.configuration
+    return unencrypted, conf
+
+  def NextDictBrute(self):
+    if self.lastkey == "Z"*self.model["RotorsCount"]:
+      line = self.lastline + 1
+      configuration = json.loads(self.lines[line].replace("\n", ""))
+      self.myenigma = Enigma(configuration)
+      self.lastline = line
+      self.lastconf = configuration
+      self.lastkey = "A"*self.model["RotorsCount"]
+    else:
+      i = -1
+      while self.lastkey[i] == "Z":
+        self.lastkey = self.lastkey[:i] + "A" + self.lastkey[i:][1:]
+        i -= 1
+      self.lastkey = self.lastkey[:i] + chr(ord(self.lastkey[i])+1) + self.lastkey[i:][1:]
+    unencrypted = self.myenigma.Process(self.text, self.lastkey)
+    currentkey = copy.deepcopy(self.lastkey)
+    conf = copy.deepcopy(self.lastconf)
+    return unencrypted, conf, currentkey
+
+  def NextDictPlug(self):
+    if self.lastplug == "YZ":
+      self.lastline += 1
+      self.configuration = json.loads(self.lines[self.lastline].replace("\n", ""))
+      self.lastplug = "AB"
+    else:
+      if self.lastplug[1] == "Z":
+        self.lastplug = chr(ord(self.lastplug[0])+1) + chr(ord(self.lastplug[0])+2)
+      else:
+        self.lastplug = self.lastplug[0] + chr(ord(self.lastplug[1])+1)
+    self.configuration["Plugboard"] = self.lastplug
+    myenigma = Enigma(self.configuration)
+    unencrypted = myenigma.Process(self.text, self.configuration["Key"])
+    return unencrypted, self.configuration
+
+  def ProcessSameConf(self, text):
+    result = self.myenigma.Process(text, self.lastkey)
+    return result
+
+
+
+
+def countbruteforce(model_configurations):
+  if model_configurations["Duplicates"]:
+    rotorscount = len(model_configurations["Rotors"])**model_configurations["RotorsCount"]
+  else:
+    rotorscount = 1
+    for i in range(model_configurations["RotorsCount"]):
+      rotorscount = rotorscount*(len(model_configurations["Rotors"])-i)
+  keyscount = 26**model_configurations["RotorsCount"]
+  reflectorscount = len(model_configurations["Reflectors"])
+  return rotorscount*keyscount*reflectorscount, rotorscount*reflectorscount
+
+
+
+class Decryptor:
+  # Keeps the last "maxsize" used machines, so repeated configurations are not rebuilt.
+  # Not thread-safe: Enigma.Process moves the rotors, use one Decryptor per thread.
+  def __init__(self, maxsize=128):
+    self.maxsize = maxsize
+    self.machines = collections.OrderedDict()
+
+  def Machine(self, configuration):
+    machinekey = (configuration["Rotors"], configuration["Reflector"], tuple(configuration["Ring"]), configuration["Plugboard"])
+    if machinekey in self.machines:
+      self.machines.move_to_end(machinekey)
+    else:
+      self.machines[machinekey] = Enigma(configuration)
+      if len(self.machines) > self.maxsize:
+        self.machines.popitem(last=False)
+    return self.machines[machinekey]
+
+  def DecryptMany(self, configs, ciphertexts):
+    if len(configs) != len(ciphertexts):
+      raise ValueError("configs and ciphertexts must have the same length")
+    results = []
+    for configuration, text in zip(configs, ciphertexts):
+      if isinstance(configuration, str):
+        configuration = json.loads(configuration)
+      results.append(self.Machine(configuration).Process(text, configuration["Key"]))
+    return results
+
+
+
+decryptors = threading.local()
+
+def decrypt_many(configs, ciphertexts, decryptor=None):
+  if decryptor is None:
+    if not hasattr(decryptors, "default"):
+      decryptors.default = Decryptor()
+    decryptor = decryptors.default
+  return decryptor.DecryptMany(configs, ciphertexts)
@@ -0,0 +1,22 @@
+def calcic(text):
+  letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+  letterscount = 0
+  total = len(text)*(len(text)-1)
+  for letter in letters:
+    nq = text.count(letter)
+    letterscount += nq*(nq-1)
+  return letterscount/total
+
+
+
+def calcfrequencies(text):
+  letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+  frequencies = {}
+  total = len(text)
+  nb = 0
+  for letter in letters:
+    counter = text.count(letter)
+    frequencies[letter] = counter/total
+    if counter > 0:
+      nb += 1
+  return frequencies, nb
@@ -0,0 +1,53 @@
+import json
+import random
+from enigmacracker import Enigma, rotor_coincidence_attack, rotor_coincidence_screening_attack
+
+
+PLAINTEXT = "ITWASTHEBESTOFTIMESITWASTHEWORSTOFTIMESITWASTHEAGEOFWISDOMITWASTHEAGEOFFOOLISHNESSITWASTHEEPOCHOFBELIEFITWASTHEEPOCHOFINCREDULITY"
+MODEL = {"Rotors":["I", "II", "III", "IV", "V"], "RotorsCount":3, "Duplicates":False, "Reflectors":["B", "C"], "Plugboard":6}
+
+
+def write_dictionnary(path):
+  rnd = random.Random(0)
+  letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+  confs = []
+  for i in range(60):
+    rotors = " ".join(rnd.sample(MODEL["Rotors"], 3))
+    key = "".join(rnd.choice(letters) for n in range(3))
+    confs.append({"Rotors":rotors, "Reflector":rnd.choice(MODEL["Reflectors"]), "Ring":[0, 0, 0], "Plugboard":"", "Key":key})
+  true = {"Rotors":"II IV V", "Reflector":"B", "Ring":[0, 0, 0], "Plugboard":"", "Key":"QWE"}
+  confs.insert(17, true)
+  path.write_text("".join(json.dumps(conf) + "\n" for conf in confs))
+  return Enigma(true).Process(PLAINTEXT, "QWE"), json.dumps(true), len(confs)
+
+
+def test_screening_full_ratio_matches_full_attack(tmp_path):
+  dictionnary = tmp_path / "dict"
+  ciphertext, true, nbpos = write_dictionnary(dictionnary)
+  rotor_coincidence_attack(ciphertext, 3, str(dictionnary), MODEL, nbpos, str(tmp_path / "full"))
+  stats = rotor_coincidence_screening_attack(ciphertext, 3, str(dictionnary), MODEL, nbpos, str(tmp_path / "screen"), 1.0, 40)
+  assert (tmp_path / "screen").read_text() == (tmp_path / "full").read_text()
+  assert (tmp_path / "full").read_text().splitlines()[-1] == true
+  assert stats == {"TwoPhase":True, "ScreenLength":40, "Shortlist":nbpos, "Characters":nbpos*40 + nbpos*len(ciphertext), "FullCharacters":nbpos*len(ciphertext)}
+
+
+def test_screening_benchmark_stats(tmp_path):
+  dictionnary = tmp_path / "dict"
+  ciphertext, true, nbpos = write_dictionnary(dictionnary)
+  stats = rotor_coincidence_screening_attack(ciphertext, 3, str(dictionnary), MODEL, nbpos, str(tmp_path / "screen"), 1.0, 40, benchmark=True)
+  assert stats["Recall"] == 1.0
+  assert stats["BestKept"]
+  assert stats["BenchmarkCharacters"] == 2*nbpos*len(ciphertext)
+  stats = rotor_coincidence_screening_attack(ciphertext, 3, str(dictionnary), MODEL, nbpos, str(tmp_path / "small"), 0.05, 40, benchmark=True)
+  assert stats["Shortlist"] == 3
+  saved = (tmp_path / "small").read_text().splitlines()
+  assert stats["Recall"] == len(set(saved) & set((tmp_path / "screen").read_text().splitlines()))/3
+
+
+def test_screening_falls_back_on_short_text(tmp_path):
+  dictionnary = tmp_path / "dict"
+  ciphertext, true, nbpos = write_dictionnary(dictionnary)
+  rotor_coincidence_attack(ciphertext, 3, str(dictionnary), MODEL, nbpos, str(tmp_path / "full"))
+  stats = rotor_coincidence_screening_attack(ciphertext, 3, str(dictionnary), MODEL, nbpos, str(tmp_path / "screen"), 0.1)
+  assert not stats["TwoPhase"]
+  assert (tmp_path / "screen").read_text() == (tmp_path / "full").read_text()
@@ -0,0 +1,43 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from enigmacracker import Enigma, Decryptor, decrypt_many
+
+
+CONF1 = {"Rotors":"II IV V", "Reflector":"B", "Ring":[0, 0, 0], "Plugboard":"AV BS CG DL FU HZ", "Key":"WXC"}
+CONF2 = {"Rotors":"II IV I", "Reflector":"C", "Ring":[1, 3, 0], "Plugboard":"AB TU ND JK LP XS", "Key":"LKI"}
+
+
+def test_decrypt_many_matches_process():
+  texts = ["HELLOWORLD", "FZFZVEQXCN", "ELHVMLEEEU"]
+  configs = [CONF1, CONF2, dict(CONF1, Key="AAA")]
+  expected = [Enigma(conf).Process(text, conf["Key"]) for conf, text in zip(configs, texts)]
+  assert decrypt_many(configs, texts) == expected
+  assert decrypt_many(configs, texts, Decryptor()) == expected
+
+
+def test_decrypt_many_json_configs():
+  assert decrypt_many([json.dumps(CONF1)], ["HELLOWORLD"]) == decrypt_many([CONF1], ["HELLOWORLD"])
+
+
+def test_decrypt_many_length_mismatch():
+  with pytest.raises(ValueError):
+    decrypt_many([CONF1, CONF2], ["HELLOWORLD"])
+
+
+def test_decryptor_reuses_and_bounds_machines():
+  decryptor = Decryptor(maxsize=1)
+  machine = decryptor.Machine(CONF1)
+  assert decryptor.Machine(dict(CONF1, Key="AAA")) is machine
+  decryptor.DecryptMany([CONF2, CONF1], ["HELLO", "HELLO"])
+  assert len(decryptor.machines) == 1
+  assert decryptor.Machine(CONF1) is not machine
+
+
+def test_import_has_no_side_effects():
+  code = "import sys, enigmacracker, EnigmaCracker; assert 'progressbar' not in sys.modules"
+  result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+  assert result.returncode == 0, result.stderr
+  assert result.stdout == ""